@@ -35,19 +35,25 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import NoReturn
 
-from jinja2 import Environment, FileSystemLoader
-
 from .idd_parser import parse_idd
-from .typed_emitter import emit_kwarg_typeddicts, emit_idf_overloads
+from .typed_emitter import (
+    emit_idf_overloads,
+    emit_kwarg_typeddicts,
+    template_environment,
+)
 
 
 def _compute_sha256(path: Path) -> str:
     """Return the SHA256 hex digest of a file."""
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1 << 20), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _write_all(pairs: list[tuple[Path, str]]) -> None:
+    """Write each ``(path, text)`` pair, opening every file once for a single write."""
+    for path, text in pairs:
+        with path.open("w", encoding="utf-8", newline="\n") as f:
+            f.write(text)
 
 
 def main() -> NoReturn:
@@ -81,27 +87,23 @@ def main() -> NoReturn:
     # Compose full version with patch; patch may be zero
     eplus_full = f"{eplus_minor}.{args.patch}"
     out_root = Path(args.out)
-    # Parse IDD objects
+    # Parse IDD objects (already sorted by key)
     objs = parse_idd(idd_path)
     idd_sha = _compute_sha256(idd_path)
     timestamp = datetime.now(tz=timezone.utc).isoformat()
     header = f"EnergyPlus {eplus_minor} | idd sha256: {idd_sha}"
-    # Set up Jinja environment
-    template_dir = Path(__file__).resolve().parent / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=False,
-        keep_trailing_newline=True,
-        lstrip_blocks=True,
-        trim_blocks=True,
-    )
+    # Set up Jinja environment shared by every generated file
+    env = template_environment()
+    # Stub package files other than the streamed _kwargs/overloads modules
+    # are collected here and written together at the end
+    files: list[tuple[Path, str]] = []
     # Write eppy-stubs package
     eppy_pkg = out_root / f"eppy-stubs-{eplus_full}"
     eppy_src = eppy_pkg / "src" / "eppy"
     eppy_src.mkdir(parents=True, exist_ok=True)
     # Emit kwargs TypedDicts and overloads
-    emit_kwarg_typeddicts(objs, eppy_src / "_kwargs.pyi", header)
-    emit_idf_overloads(objs, eppy_src / "idf_overloads.pyi")
+    emit_kwarg_typeddicts(objs, eppy_src / "_kwargs.pyi", header, env)
+    emit_idf_overloads(objs, eppy_src / "idf_overloads.pyi", env)
     # Generate minimal idf.pyi mixing in overloads
     idf_content = (
         "from __future__ import annotations\n"
@@ -109,7 +111,7 @@ def main() -> NoReturn:
         "class IDF(_IDFOverloads):\n"
         "    ...\n"
     )
-    (eppy_src / "idf.pyi").write_text(idf_content, encoding="utf-8")
+    files.append((eppy_src / "idf.pyi", idf_content))
     # Render eppy __init__.pyi and README.md
     ctx = {
         "eplus_minor": eplus_minor,
@@ -117,9 +119,9 @@ def main() -> NoReturn:
         "timestamp_utc": timestamp,
     }
     init_template = env.get_template("eppy/__init__.pyi.j2")
-    (eppy_src / "__init__.pyi").write_text(init_template.render(ctx), encoding="utf-8")
+    files.append((eppy_src / "__init__.pyi", init_template.render(ctx)))
     readme_template = env.get_template("eppy/README.md.j2")
-    (eppy_pkg / "README.md").write_text(readme_template.render(ctx), encoding="utf-8")
+    files.append((eppy_pkg / "README.md", readme_template.render(ctx)))
     # Write pyproject.toml for eppy-stubs
     # Build the pyproject for eppy-stubs.  Escape braces for f-string literal.
     pyproject_eppy = (
@@ -144,7 +146,7 @@ def main() -> NoReturn:
         "[tool.hatch.build]\n"
         "artifacts = [\"generated_by.json\"]\n"""
     )
-    (eppy_pkg / "pyproject.toml").write_text(pyproject_eppy, encoding="utf-8")
+    files.append((eppy_pkg / "pyproject.toml", pyproject_eppy))
     # Write generated_by.json for eppy
     provenance = {
         "energyplus_version": eplus_full,
@@ -156,7 +158,7 @@ def main() -> NoReturn:
             "docstrings": True,
         },
     }
-    (eppy_pkg / "generated_by.json").write_text(json.dumps(provenance, indent=2), encoding="utf-8")
+    files.append((eppy_pkg / "generated_by.json", json.dumps(provenance, indent=2)))
     # Write archetypal-stubs package
     arch_pkg = out_root / f"archetypal-stubs-{eplus_full}"
     arch_src = arch_pkg / "src" / "archetypal"
@@ -171,15 +173,15 @@ def main() -> NoReturn:
         "class IDF(_GmIDF, _IDFOverloads):\n"
         "    ...\n"
     )
-    (arch_src / "idf.pyi").write_text(arch_idf_content, encoding="utf-8")
+    files.append((arch_src / "idf.pyi", arch_idf_content))
     # geomeppy shim
     gm_content = "class IDF:\n    ...\n"
-    (gm_src / "__init__.pyi").write_text(gm_content, encoding="utf-8")
+    files.append((gm_src / "__init__.pyi", gm_content))
     # archetypal __init__ and README
     init_arch_template = env.get_template("archetypal/__init__.pyi.j2")
-    (arch_src / "__init__.pyi").write_text(init_arch_template.render(ctx), encoding="utf-8")
+    files.append((arch_src / "__init__.pyi", init_arch_template.render(ctx)))
     readme_arch_template = env.get_template("archetypal/README.md.j2")
-    (arch_pkg / "README.md").write_text(readme_arch_template.render(ctx), encoding="utf-8")
+    files.append((arch_pkg / "README.md", readme_arch_template.render(ctx)))
     # pyproject.toml for archetypal-stubs
     pyproject_arch = (
         f"""[build-system]\n"
@@ -206,9 +208,10 @@ def main() -> NoReturn:
         "[tool.hatch.build]\n"
         "artifacts = [\"generated_by.json\"]\n"""
     )
-    (arch_pkg / "pyproject.toml").write_text(pyproject_arch, encoding="utf-8")
+    files.append((arch_pkg / "pyproject.toml", pyproject_arch))
     # generated_by.json for archetypal
-    (arch_pkg / "generated_by.json").write_text(json.dumps(provenance, indent=2), encoding="utf-8")
+    files.append((arch_pkg / "generated_by.json", json.dumps(provenance, indent=2)))
+    _write_all(files)
     # Done
     raise SystemExit(0)
 
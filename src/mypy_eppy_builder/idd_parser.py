@@ -13,9 +13,13 @@ overloads for static type checkers.
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Iterator, Literal
+from typing import Literal
 
 FieldKind = Literal[
     "alpha",
@@ -29,6 +33,31 @@ FieldKind = Literal[
 ]
 
 
+# Numeric ``\key`` values that _parse_choice may convert to integers
+_NUM_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+# Line prefixes tested with a single tuple-form ``str.startswith`` call
+_FIELD_HEADER = ("A", "N")
+_FIELD_END = ("A", "N", "\\begin-object", "\\end-object")
+_REQUIRED = ("\\required-field", "\\required-object")
+
+# Field directives keyed on the letter following the backslash
+_DIRECTIVES: dict[str, str | tuple[str, ...]] = {
+    "f": "\\field",
+    "t": "\\type",
+    "r": _REQUIRED,
+    "d": "\\default",
+    "k": "\\key",
+    "b": "\\blank",
+}
+
+# Sort key for IDDObject instances
+_KEY = attrgetter("key")
+
+# Shared choices tuple for the common case of fields without ``\key`` values
+_EMPTY: tuple[str | int, ...] = ()
+
+
 @dataclass(slots=True, frozen=True)
 class IDDField:
     """Represents a field within an IDD object.
@@ -37,19 +66,19 @@ class IDDField:
         index: Numerical index of the field (1-based) extracted from the A#/N#
             label.  If the index is missing or not parsable, zero is used.
         name_raw: The raw field name as it appears in the IDD after the
-            `\field` directive.
+            `\\field` directive.
         kind: Normalized type of the field.  One of the values from
             :data:`FieldKind`.
         choices: Permitted values when the field is a choice.  Strings are
             stored verbatim; numeric values are converted to integers when
             appropriate.
         required: Whether the field is marked as required via
-            ``\required-field`` or ``\required-object``.
+            ``\\required-field`` or ``\\required-object``.
         allows_blank: Whether the field may be left blank according to a
-            ``\blank`` directive.  Blank fields are treated as optional in
+            ``\\blank`` directive.  Blank fields are treated as optional in
             the generated TypedDicts.
         has_default: Whether the field has a default value specified via
-            a ``\default`` directive.  Defaults imply optionality in the
+            a ``\\default`` directive.  Defaults imply optionality in the
             emitted types.
     """
 
@@ -82,7 +111,7 @@ def parse_idd(path: Path) -> list[IDDObject]:
     """Parse an EnergyPlus IDD file into a list of objects.
 
     The parser removes comments and notes, then detects object boundaries
-    marked by ``\begin-object`` and ``\end-object``.  Within each object it
+    marked by ``\\begin-object`` and ``\\end-object``.  Within each object it
     scans ``A#`` and ``N#`` definitions followed by backslash directives to
     collect metadata.  Unknown directives are ignored.
 
@@ -90,45 +119,57 @@ def parse_idd(path: Path) -> list[IDDObject]:
         path: Path to the ``Energy+.idd`` file to parse.
 
     Returns:
-        A list of :class:`IDDObject` entries preserving the order of
-        appearance in the IDD.
+        A list of :class:`IDDObject` entries sorted by key, giving emitters
+        and other consumers a deterministic order.
     """
+    # Strip ``!`` comments and surrounding whitespace in a single pass.  The
+    # text is decoded before splitting so line breaks and whitespace follow
+    # str semantics (e.g. a leading no-break space is stripped).
     text = path.read_text(encoding="utf-8", errors="replace")
-    lines = _strip_comments(text.splitlines())
+    lines: list[str] = []
+    for raw in text.splitlines():
+        bang = raw.find("!")
+        s = (raw if bang < 0 else raw[:bang]).strip()
+        if s:
+            lines.append(s)
     objects: list[IDDObject] = []
-    it = iter(enumerate(lines, start=1))
-    for _, line in it:
+    cur = _Cursor(lines)
+    n = len(lines)
+    while cur.i < n:
+        line = lines[cur.i]
+        cur.i += 1
         # Objects start with \begin-object <key>
         if line.startswith("\\begin-object"):
-            key = _extract_after(line, "\\begin-object")
+            # Keys and field names are hashed and compared repeatedly
+            # downstream (sorting, caches), so intern them
+            key = sys.intern(_extract_after(line, "\\begin-object"))
             fields: list[IDDField] = []
             # Capture fields until \end-object
-            for _, l2 in it:
+            while cur.i < n:
+                l2 = lines[cur.i]
+                cur.i += 1
                 if l2.startswith("\\end-object"):
                     break
-                if l2.startswith("A") or l2.startswith("N"):
-                    f = _parse_field_block(l2, it)
+                if l2.startswith(_FIELD_HEADER):
+                    f = _parse_field_block(l2, cur)
                     fields.append(f)
-            objects.append(IDDObject(key=key, fields=tuple(fields)))
+            objects.append(IDDObject(key, tuple(fields)))
+    objects.sort(key=_KEY)
     return objects
 
 
-def _strip_comments(lines: Iterable[str]) -> list[str]:
-    """Remove inline comments and blank lines.
+class _Cursor:
+    """Position within the stripped IDD lines shared by the parsing helpers.
 
-    EnergyPlus uses ``!`` to denote comments that run to the end of the line.
-    This helper removes everything after the first ``!`` and strips
-    whitespace.  Empty lines and lines that become empty after stripping are
-    omitted from the result.
+    Helpers advance :attr:`i` as they consume lines; pushing a line back is
+    simply a matter of decrementing it.
     """
-    out: list[str] = []
-    for raw in lines:
-        # split on ! and keep the code before comment
-        s = raw.split("!", 1)[0].strip()
-        if not s:
-            continue
-        out.append(s)
-    return out
+
+    __slots__ = ("i", "lines")
+
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+        self.i = 0
 
 
 def _extract_after(line: str, prefix: str) -> str:
@@ -137,23 +178,26 @@ def _extract_after(line: str, prefix: str) -> str:
     return s.strip(",; ")
 
 
-def _parse_field_block(first_line: str, it: Iterator[tuple[int, str]]) -> IDDField:
+def _parse_field_block(first_line: str, cur: _Cursor) -> IDDField:
     """Parse a field definition starting at its ``A#`` or ``N#`` header.
 
-    The caller passes an iterator that yields subsequent lines.  This
+    The caller passes a cursor positioned just after the header line.  This
     function consumes lines until it encounters the next ``A``/``N``
-    header, a ``\begin-object`` directive, or a ``\end-object`` directive.  It
-    builds an :class:`IDDField` with the collected metadata.
+    header, a ``\\begin-object`` directive, or a ``\\end-object`` directive,
+    leaving the cursor on that line so the caller sees it next.  A directive
+    written on the header line itself (``A1 , \\field Name``) is honoured as
+    well.  It builds an :class:`IDDField` with the collected metadata.
 
     Args:
         first_line: The header line starting with ``A`` or ``N``.
-        it: An iterator over remaining line tuples (index, text).
+        cur: Cursor over the remaining stripped lines.
 
     Returns:
         A fully populated :class:`IDDField`.
     """
     # Header example: 'A1 , \field Name'
-    idx_part = first_line.split()[0]
+    head, sep, inline = first_line.partition("\\")
+    idx_part = head.strip(" ,;")
     index = int(idx_part[1:]) if len(idx_part) > 1 and idx_part[1:].isdigit() else 0
     name_raw = "Field"
     kind: FieldKind = "unknown"
@@ -162,56 +206,57 @@ def _parse_field_block(first_line: str, it: Iterator[tuple[int, str]]) -> IDDFie
     has_default = False
     choices: list[str | int] = []
 
-    # Continue reading directives until next field or object end
-    for _, line in it:
-        if line.startswith("A") or line.startswith("N") or line.startswith("\\begin-object"):
-            # push the line back and break
-            it = _pushback(it, (0, line))
+    lines = cur.lines
+    n = len(lines)
+    # Start with any directive trailing the header, then read directives
+    # until the next field or object boundary
+    line = sep + inline
+    while True:
+        # Field directives: the letter after the backslash picks the branch
+        # and its full directive name confirms the match.  Numeric bounds,
+        # notes and other directives are irrelevant for typing.
+        prefix = _DIRECTIVES.get(line[1:2]) if line[:1] == "\\" else None
+        if prefix is not None and line.startswith(prefix):
+            match line[1]:
+                case "f":
+                    name_raw = sys.intern(_extract_after(line, "\\field"))
+                case "t":
+                    t = _extract_after(line, "\\type").lower()
+                    kind = _normalize_kind(t)
+                case "r":
+                    required = True
+                case "d":
+                    has_default = True
+                case "k":
+                    val = _extract_after(line, "\\key")
+                    choices.append(_parse_choice(val))
+                case "b":
+                    # blank allowable directive
+                    allows_blank = True
+        if cur.i >= n:
             break
-        if line.startswith("\\end-object"):
+        line = lines[cur.i]
+        cur.i += 1
+        if line.startswith(_FIELD_END):
+            # push the line back for the caller
+            cur.i -= 1
             break
-        # Field directives
-        if line.startswith("\\field"):
-            name_raw = _extract_after(line, "\\field")
-        elif line.startswith("\\type"):
-            t = _extract_after(line, "\\type").lower()
-            kind = _normalize_kind(t)
-        elif line.startswith("\\required-field") or line.startswith("\\required-object"):
-            required = True
-        elif line.startswith("\\default"):
-            has_default = True
-        elif line.startswith("\\minimum") or line.startswith("\\maximum"):
-            # ignore numeric bounds for typing
-            pass
-        elif line.startswith("\\key"):
-            val = _extract_after(line, "\\key")
-            choices.append(_parse_choice(val))
-        elif line.startswith("\\blank"):
-            # blank allowable directive
-            allows_blank = True
-        elif line.startswith("\\note"):
-            # ignore notes
-            pass
     # If choices are present and the kind is not numeric or boolean, treat as choice
     if choices and kind not in ("integer", "real", "boolean"):
         kind = "choice"
+    # Positional arguments match the IDDField declaration order
     return IDDField(
-        index=index,
-        name_raw=name_raw,
-        kind=kind,
-        choices=tuple(choices),
-        required=required,
-        allows_blank=allows_blank,
-        has_default=has_default,
+        index,
+        name_raw,
+        kind,
+        tuple(choices) if choices else _EMPTY,
+        required,
+        allows_blank,
+        has_default,
     )
 
 
-def _pushback(it: Iterator[tuple[int, str]], item: tuple[int, str]) -> Iterator[tuple[int, str]]:
-    """Return a new iterator that yields a single item followed by the original iterator."""
-    yield item
-    yield from it
-
-
+@cache
 def _normalize_kind(t: str) -> FieldKind:
     """Normalize a type string from the IDD to one of the FieldKind values."""
     if t in {"alpha", "string"}:
@@ -232,20 +277,20 @@ def _normalize_kind(t: str) -> FieldKind:
 
 
 def _parse_choice(val: str) -> str | int:
-    """Parse a ``\key`` value into an int if possible, otherwise return the string.
+    """Parse a ``\\key`` value into an int if possible, otherwise return the string.
 
     EnergyPlus permits numeric choice keys.  If the string represents an
     integer, return the integer; if it represents a float that is integral
     (e.g. ``"1.0"``) convert to an int as well.  Otherwise return the raw
-    string.
+    string, interned since the same keys recur throughout the IDD.
     """
     val = val.strip()
+    # Nearly all keys are words; only numeric-looking ones go through float()
+    if not _NUM_RE.fullmatch(val):
+        return sys.intern(val)
     if val.isdigit():
         return int(val)
-    try:
-        f = float(val)
-        if f.is_integer():
-            return int(f)
-        return val
-    except ValueError:
-        return val
\ No newline at end of file
+    f = float(val)
+    if f.is_integer():
+        return int(f)
+    return val
@@ -25,106 +25,173 @@ emit two `.pyi` modules:
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from functools import cache
 from pathlib import Path
-from typing import Iterable
+from typing import IO
 
-from .idd_parser import IDDObject, IDDField
+from jinja2 import Environment, FileSystemLoader
+
+from .idd_parser import FieldKind, IDDField, IDDObject
 
 __all__ = [
     "emit_kwarg_typeddicts",
     "emit_idf_overloads",
+    "template_environment",
 ]
 
 
-def emit_kwarg_typeddicts(objs: Iterable[IDDObject], out_file: Path, header: str) -> None:
+def template_environment() -> Environment:
+    """Return the Jinja environment rendering the bundled ``templates``.
+
+    The same environment renders the streamed ``_kwargs.pyi`` and
+    ``idf_overloads.pyi`` modules and the smaller package files written by
+    :mod:`~mypy_eppy_builder.build_cli`.
+    """
+    template_dir = Path(__file__).resolve().parent / "templates"
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=False,
+        keep_trailing_newline=True,
+        lstrip_blocks=True,
+        trim_blocks=True,
+    )
+
+
+def emit_kwarg_typeddicts(
+    objs: Sequence[IDDObject],
+    out_file: Path | IO[str],
+    header: str,
+    env: Environment | None = None,
+) -> None:
     """Write a ``_kwargs.pyi`` module containing ``TypedDict`` definitions.
 
+    The module is rendered from ``eppy/_kwargs.pyi.j2`` and streamed to the
+    output one object at a time.
+
     Args:
-        objs: Iterable of parsed EnergyPlus objects.  Each object's key and
-            fields are used to construct a corresponding ``TypedDict``.
-        out_file: Path to the output file (typically ``src/eppy/_kwargs.pyi``).
+        objs: Parsed EnergyPlus objects, pre-sorted by key as returned by
+            :func:`~mypy_eppy_builder.idd_parser.parse_idd`.  Each object's
+            key and fields are used to construct a corresponding
+            ``TypedDict``.
+        out_file: Path to the output file (typically ``src/eppy/_kwargs.pyi``)
+            or an open text stream to write to.
         header: A short description written as a comment at the top of the
             file; use this to record provenance (EnergyPlus version, IDD hash).
+        env: Jinja environment to render with; defaults to
+            :func:`template_environment`.
     """
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    lines: list[str] = []
-    lines.append("from __future__ import annotations")
-    lines.append("from typing import TypedDict, Required, NotRequired, Literal")
-    lines.append("")
-    if header:
-        lines.append(f"# {header}")
-        lines.append("")
-    for obj in sorted(objs, key=lambda o: o.key):
-        td_name = _kwargs_typeddict_name(obj.key)
-        lines.append(f"class {td_name}(TypedDict, total=False):")
-        if not obj.fields:
-            lines.append("    pass")
-            lines.append("")
-            continue
-        for field in obj.fields:
-            key = _snake_case(field.name_raw)
-            typ = _py_type(field)
-            req = "Required" if field.required else "NotRequired"
-            # If the field allows blank or has default and isn't required, allow None
-            if (field.allows_blank or field.has_default) and not field.required:
-                if "None" not in typ:
-                    typ = f"{typ} | None"
-            # Write a one-line comment with the original field name
-            lines.append(f"    # {field.name_raw}")
-            lines.append(f"    {key}: {req}[{typ}]")
-        lines.append("")
-    out_file.write_text("\n".join(lines), encoding="utf-8")
+    template = (env or template_environment()).get_template("eppy/_kwargs.pyi.j2")
+    stream = template.stream(header=header, typeddicts=_typeddict_rows(objs))
+    with _open_output(out_file) as f:
+        f.writelines(stream)
 
 
-def emit_idf_overloads(objs: Iterable[IDDObject], out_file: Path) -> None:
+def emit_idf_overloads(
+    objs: Sequence[IDDObject],
+    out_file: Path | IO[str],
+    env: Environment | None = None,
+) -> None:
     """Write an ``idf_overloads.pyi`` module defining typed overloads.
 
     Each EnergyPlus object key results in a separate overload for
     ``newidfobject``.  The overloads live on a private mixin class named
     ``_IDFOverloads``.  A final catch-all implementation accepts any
     ``str`` key and untyped ``kwargs``.  Consumers import and mix in this
-    class to extend their ``IDF`` stubs.
+    class to extend their ``IDF`` stubs.  The module is rendered from
+    ``eppy/idf_overloads.pyi.j2``.
 
     Args:
-        objs: Iterable of parsed EnergyPlus objects.
-        out_file: Path to the output file (e.g., ``src/eppy/idf_overloads.pyi``).
+        objs: Parsed EnergyPlus objects, pre-sorted by key.
+        out_file: Path to the output file (e.g., ``src/eppy/idf_overloads.pyi``)
+            or an open text stream to write to.
+        env: Jinja environment to render with; defaults to
+            :func:`template_environment`.
     """
-    out_file.parent.mkdir(parents=True, exist_ok=True)
-    lines: list[str] = []
-    lines.append("from __future__ import annotations")
-    lines.append("from typing import overload, Unpack, Literal")
-    lines.append("from .bunch import EPBunch")
-    lines.append("from ._kwargs import *")
-    lines.append("")
-    lines.append("class _IDFOverloads:")
-    for obj in sorted(objs, key=lambda o: o.key):
-        td = _kwargs_typeddict_name(obj.key)
-        key_literal = obj.key
-        lines.append("    @overload")
-        lines.append(
-            f"    def newidfobject(self, key: Literal['{key_literal}'], **kwargs: Unpack[{td}]) -> EPBunch: ..."
-        )
-    # Catch-all overload at the end
-    lines.append(
-        "    def newidfobject(self, key: str, **kwargs) -> EPBunch: ..."
-    )
-    lines.append("")
-    out_file.write_text("\n".join(lines), encoding="utf-8")
+    template = (env or template_environment()).get_template("eppy/idf_overloads.pyi.j2")
+    overloads = ((obj.key, _kwargs_typeddict_name(obj.key)) for obj in objs)
+    with _open_output(out_file) as f:
+        f.writelines(template.stream(overloads=overloads))
 
 
 # Helper functions
 
+def _typeddict_rows(objs: Sequence[IDDObject]) -> Iterator[tuple[str, list[tuple[str, str, str, str]]]]:
+    """Yield the ``(typeddict_name, fields)`` pairs rendered by ``_kwargs.pyi.j2``.
+
+    Each field is a ``(key, requiredness, type, raw_name)`` tuple.  Rows are
+    produced lazily so the template stream never holds more than one object.
+    """
+    for obj in objs:
+        fields: list[tuple[str, str, str, str]] = []
+        for field in obj.fields:
+            name = field.name_raw
+            req_flag = field.required
+            blank = field.allows_blank
+            deflt = field.has_default
+            key = _snake_case(name)
+            typ = _py_type(field)
+            req = "Required" if req_flag else "NotRequired"
+            # If the field allows blank or has default and isn't required, allow None
+            if (blank or deflt) and not req_flag:
+                if "None" not in typ:
+                    typ = f"{typ} | None"
+            fields.append((key, req, typ, name))
+        yield _kwargs_typeddict_name(obj.key), fields
+
+
+def _open_output(out_file: Path | IO[str]) -> AbstractContextManager[IO[str]]:
+    """Open ``out_file`` for writing, or pass an already open stream through.
+
+    Paths get their parent directories created and are opened with LF
+    line endings; streams are left open for the caller to close.
+    """
+    if isinstance(out_file, Path):
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+        return out_file.open("w", encoding="utf-8", newline="\n")
+    return nullcontext(out_file)
+
+
+class _IdentifierTable(dict[int, str]):
+    """``str.translate`` table mapping non-alphanumeric characters to ``_``.
+
+    Entries are computed on first lookup, so any code point is handled while
+    repeated characters cost a single dict hit.  With ``lower`` set, letters
+    are lowercased as well.
+    """
+
+    def __init__(self, lower: bool) -> None:
+        super().__init__()
+        self.lower = lower
+
+    def __missing__(self, c: int) -> str:
+        ch = chr(c)
+        if not ch.isalnum():
+            ch = "_"
+        elif self.lower:
+            ch = ch.lower()
+        self[c] = ch
+        return ch
+
+
+_TYPEDDICT_NAME_TABLE = _IdentifierTable(lower=False)
+_SNAKE_TABLE = _IdentifierTable(lower=True)
+
+
+@cache
 def _kwargs_typeddict_name(key: str) -> str:
     """Return a valid ``TypedDict`` name for a given EnergyPlus object key.
 
     Non-alphanumeric characters are replaced with underscores, repeated
     underscores are collapsed, and a ``_Kwargs`` suffix is added.
     """
-    key_norm = "".join(ch if ch.isalnum() else "_" for ch in key)
+    key_norm = key.translate(_TYPEDDICT_NAME_TABLE)
     key_norm = "_".join(filter(None, key_norm.split("_")))
     return f"{key_norm}_Kwargs"
 
 
+@cache
 def _snake_case(label: str) -> str:
     """Convert a human-readable field label to snake_case.
 
@@ -132,7 +199,7 @@ def _snake_case(label: str) -> str:
     underscores, collapses multiple underscores, and prefixes a leading
     underscore if the first character is numeric.
     """
-    s = "".join(ch.lower() if ch.isalnum() else "_" for ch in label)
+    s = label.translate(_SNAKE_TABLE)
     s = "_".join(filter(None, s.split("_")))
     if s and s[0].isdigit():
         s = f"_{s}"
@@ -151,23 +218,37 @@ def _py_type(field: IDDField) -> str:
     * ``choice`` maps to a ``Literal`` containing the exact keys.
     * Unknown kinds fall back to ``str | float | int``.
     """
-    if field.kind in {"alpha", "node", "object-list"}:
+    return _py_type_for(field.kind, field.choices)
+
+
+@cache
+def _py_type_for(kind: FieldKind, choices: tuple[str | int, ...]) -> str:
+    """Return the annotation for a kind/choices pair; cached.
+
+    Only these two attributes affect the annotation, so fields sharing a
+    type (most commonly plain ``alpha`` or ``real``) hit the same entry.
+    """
+    if kind in {"alpha", "node", "object-list"}:
         return "str"
-    if field.kind == "integer":
+    if kind == "integer":
         return "int"
-    if field.kind == "real":
+    if kind == "real":
         return "float"
-    if field.kind == "boolean":
+    if kind == "boolean":
         return "bool"
-    if field.kind == "choice" and field.choices:
-        # Quote string literals; numeric values remain bare
-        elems: list[str] = []
-        for c in field.choices:
-            if isinstance(c, str):
-                elems.append(repr(c))
-            else:
-                elems.append(str(c))
-        inner = ", ".join(elems)
-        return f"Literal[{inner}]"
+    if kind == "choice" and choices:
+        return _literal_for(choices)
     # Unknown or unspecified type: accept common scalars
-    return "str | float | int"
\ No newline at end of file
+    return "str | float | int"
+
+
+@cache
+def _literal_for(choices: tuple[str | int, ...]) -> str:
+    """Return the ``Literal[...]`` annotation for a tuple of choice keys.
+
+    Choice sets such as ``('Yes', 'No')`` recur across many objects, so each
+    distinct tuple is rendered only once.
+    """
+    # Quote string literals; numeric values remain bare
+    inner = ", ".join(repr(c) if isinstance(c, str) else str(c) for c in choices)
+    return f"Literal[{inner}]"
\ No newline at end of file
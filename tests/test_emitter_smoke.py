@@ -1,9 +1,15 @@
 """Smoke tests for the typed emitter."""
 
+import io
 from pathlib import Path
 
 from mypy_eppy_builder.idd_parser import parse_idd
-from mypy_eppy_builder.typed_emitter import emit_kwarg_typeddicts, emit_idf_overloads
+from mypy_eppy_builder.typed_emitter import (
+    _kwargs_typeddict_name,
+    _snake_case,
+    emit_idf_overloads,
+    emit_kwarg_typeddicts,
+)
 
 
 def test_emitter_outputs(tmp_path: Path) -> None:
@@ -19,11 +25,40 @@ def test_emitter_outputs(tmp_path: Path) -> None:
     # Read back _kwargs.pyi
     kwargs_text = (out_eppy / "_kwargs.pyi").read_text(encoding="utf-8")
     assert "class ZONE_Kwargs" in kwargs_text
-    assert "name: Required[str]" in kwargs_text
-    assert "direction_of_relative_north: NotRequired[float]" in kwargs_text
-    assert "part_of_total_floor_area: NotRequired[Literal['Yes', 'No']]" in kwargs_text
+    # Name has no \type, so it accepts any scalar
+    assert "name: Required[str | float | int]" in kwargs_text
+    # Fields with a \default are optional and accept None
+    assert "direction_of_relative_north: NotRequired[float | None]" in kwargs_text
+    assert "x_coordinate_of_origin: NotRequired[float]" in kwargs_text
+    assert "part_of_total_floor_area: NotRequired[Literal['Yes', 'No'] | None]" in kwargs_text
     # Read back idf_overloads.pyi
     overloads = (out_eppy / "idf_overloads.pyi").read_text(encoding="utf-8")
     assert "class _IDFOverloads" in overloads
     assert "def newidfobject(self, key: Literal['ZONE'], **kwargs: Unpack[ZONE_Kwargs]) -> EPBunch" in overloads
-    assert "def newidfobject(self, key: str, **kwargs) -> EPBunch" in overloads
\ No newline at end of file
+    assert "def newidfobject(self, key: str, **kwargs) -> EPBunch" in overloads
+
+
+def test_emitter_writes_to_stream() -> None:
+    """Verify that the emitters accept an open text stream."""
+    idd_path = Path(__file__).resolve().parent.parent / "fixtures" / "idd" / "min.idd"
+    objects = parse_idd(idd_path)
+    buf = io.StringIO()
+    emit_kwarg_typeddicts(objects, buf, header="test header")
+    emit_idf_overloads(objects, buf)
+    # The stream is left open for the caller
+    text = buf.getvalue()
+    assert "# test header" in text
+    assert "class ZONE_Kwargs" in text
+    assert "class _IDFOverloads" in text
+
+
+def test_snake_case_non_latin1_punctuation() -> None:
+    """Verify that punctuation outside Latin-1 still yields valid identifiers."""
+    for label, expected in [
+        ("Temp \ufffd C", "temp_c"),
+        ("Flow Rate \u2013 Max", "flow_rate_max"),
+    ]:
+        key = _snake_case(label)
+        assert key == expected
+        assert key.isidentifier()
+    assert _kwargs_typeddict_name("Zone\u2013List") == "Zone_List_Kwargs"
@@ -13,6 +13,8 @@ def test_parse_minimal_idd(tmp_path: Path) -> None:
     # We expect exactly two objects
     assert len(objects) == 2
     keys = [obj.key for obj in objects]
+    # Objects come back sorted by key
+    assert keys == sorted(keys)
     assert "ZONE" in keys
     assert "BUILDINGSURFACE:DETAILED" in keys
     # Inspect the ZONE object fields
@@ -26,4 +28,39 @@ def test_parse_minimal_idd(tmp_path: Path) -> None:
     ]
     # The choice values should be captured
     part_field = zone.fields[-1]
-    assert set(part_field.choices) == {"Yes", "No"}
\ No newline at end of file
+    assert set(part_field.choices) == {"Yes", "No"}
+
+
+def test_parse_numeric_choice_keys(tmp_path: Path) -> None:
+    """Integral numeric keys become ints; everything else stays a string."""
+    idd_path = tmp_path / "keys.idd"
+    idd_path.write_text(
+        "\\begin-object TEST\n"
+        "A1 , \\field Mode\n"
+        "\\key 1\n"
+        "\\key 1.0\n"
+        "\\key -2\n"
+        "\\key 1e3\n"
+        "\\key 2.5\n"
+        "\\key .5\n"
+        "\\key Yes\n"
+        "\\end-object\n",
+        encoding="utf-8",
+    )
+    (obj,) = parse_idd(idd_path)
+    assert obj.fields[0].choices == (1, 1, -2, 1000, "2.5", ".5", "Yes")
+    assert obj.fields[0].kind == "choice"
+
+
+def test_parse_unicode_whitespace(tmp_path: Path) -> None:
+    """Non-ASCII whitespace around field headers is stripped like ASCII."""
+    idd_path = tmp_path / "nbsp.idd"
+    idd_path.write_text(
+        "\\begin-object TEST\n"
+        "A1 , \\field Name ! comment\n"
+        "\xa0A2 , \\field Other\n"
+        "\\end-object\n",
+        encoding="utf-8",
+    )
+    (obj,) = parse_idd(idd_path)
+    assert [(f.index, f.name_raw) for f in obj.fields] == [(1, "Name"), (2, "Other")]